@@ -2,34 +2,88 @@
 Configuration settings for Multi-Source Job Scraper
 """
 import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (project root)
+DOTENV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env")
+
+
+@lru_cache(maxsize=1)
+def _load_env(mtime: float) -> bool:
+    """Parse the .env file once per modification time."""
+    return load_dotenv(DOTENV_PATH, override=False)
+
+
+_load_env(os.path.getmtime(DOTENV_PATH) if os.path.exists(DOTENV_PATH) else 0.0)
+
+# =============================================================================
+# Environment Settings (snapshotted once at import)
+# =============================================================================
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable snapshot of environment-driven settings."""
+    aws_region: str
+    aws_access_key_id: str
+    aws_secret_access_key: str
+    sns_topic_arn: str
+    rapidapi_key: str
+    adzuna_app_id: str
+    adzuna_app_key: str
+    remoteok_enabled: bool
+    http_cache_ttl_seconds: int
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from os.environ, reading each key once."""
+        env = os.environ
+        return cls(
+            aws_region=env.get("AWS_REGION", "us-east-1"),
+            aws_access_key_id=env.get("AWS_ACCESS_KEY_ID", ""),
+            aws_secret_access_key=env.get("AWS_SECRET_ACCESS_KEY", ""),
+            sns_topic_arn=env.get("SNS_TOPIC_ARN", ""),
+            rapidapi_key=env.get("RAPIDAPI_KEY", ""),
+            adzuna_app_id=env.get("ADZUNA_APP_ID", ""),
+            adzuna_app_key=env.get("ADZUNA_APP_KEY", ""),
+            remoteok_enabled=env.get("REMOTEOK_ENABLED", "true").lower() == "true",
+            http_cache_ttl_seconds=int(env.get("HTTP_CACHE_TTL_SECONDS", "3600")),
+        )
+
+
+SETTINGS = Settings.from_env()
 
 # =============================================================================
 # AWS SNS Configuration
 # =============================================================================
-AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
-AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID", "")
-AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY", "")
-SNS_TOPIC_ARN = os.getenv("SNS_TOPIC_ARN", "")
+AWS_REGION = SETTINGS.aws_region
+AWS_ACCESS_KEY_ID = SETTINGS.aws_access_key_id
+AWS_SECRET_ACCESS_KEY = SETTINGS.aws_secret_access_key
+SNS_TOPIC_ARN = SETTINGS.sns_topic_arn
 
 # =============================================================================
 # Job Search APIs Configuration
 # =============================================================================
 # JSearch API (RapidAPI) - Primary source
 # Get your key at https://rapidapi.com/letscrape-6bRBa3QguO5/api/jsearch
-RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY", "")
+RAPIDAPI_KEY = SETTINGS.rapidapi_key
 JSEARCH_HOST = "jsearch.p.rapidapi.com"
 
 # Adzuna API - Secondary source (covers Indeed, Monster, etc.)
 # Get your keys at https://developer.adzuna.com/
-ADZUNA_APP_ID = os.getenv("ADZUNA_APP_ID", "")
-ADZUNA_APP_KEY = os.getenv("ADZUNA_APP_KEY", "")
+ADZUNA_APP_ID = SETTINGS.adzuna_app_id
+ADZUNA_APP_KEY = SETTINGS.adzuna_app_key
 
 # RemoteOK API - For remote jobs (no API key needed)
-REMOTEOK_ENABLED = os.getenv("REMOTEOK_ENABLED", "true").lower() == "true"
+REMOTEOK_ENABLED = SETTINGS.remoteok_enabled
+
+# RemoteOK tag feeds to request instead of the full feed, e.g.
+# ("data-engineer", "etl", "analytics-engineer", "data-scientist").
+# Smaller payloads, but listings tagged otherwise are missed even when their
+# title matches; empty fetches the full feed.
+REMOTEOK_TAGS = ()
 
 # =============================================================================
 # Job Search Parameters
@@ -58,6 +112,12 @@ ETL_SKILLS = [
     "dbt", "kafka", "data modeling", "bigquery", "redshift"
 ]
 
+# Single compiled alternation so skill matching is one scan per description.
+# No word boundaries: keeps the original substring semantics (e.g. "pyspark").
+# Wrapped in a lookahead so overlapping mentions are all reported, like a
+# multi-pattern (Aho-Corasick) scan would.
+ETL_SKILLS_RE = re.compile("(?=(" + "|".join(map(re.escape, ETL_SKILLS)) + "))", re.IGNORECASE)
+
 # Number of results to fetch per request
 RESULTS_PER_PAGE = 20
 MAX_PAGES_PER_SOURCE = 3  # Total max results per source: 60
@@ -65,9 +125,16 @@ MAX_PAGES_PER_SOURCE = 3  # Total max results per source: 60
 # =============================================================================
 # Output Configuration
 # =============================================================================
-OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "output")
+OUTPUT_PATH = Path(__file__).resolve().parent.parent / "output"
+OUTPUT_DIR = str(OUTPUT_PATH)
 CSV_FILENAME_PREFIX = "job_listings"
 
+# API responses are cached on disk so retries and re-runs within the TTL skip
+# the request; expired entries are revalidated with ETag/Last-Modified.
+# Set HTTP_CACHE_TTL_SECONDS=0 to disable.
+HTTP_CACHE_DIR = str(OUTPUT_PATH / "http_cache")
+HTTP_CACHE_TTL_SECONDS = SETTINGS.http_cache_ttl_seconds
+
 # =============================================================================
 # Airflow Configuration
 # =============================================================================
@@ -8,21 +8,25 @@ Automated pipeline that runs every 6 hours starting at 6AM PST to:
 4. Export results to CSV
 5. Send email notification via AWS SNS
 """
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from airflow import DAG
 from airflow.operators.python import PythonOperator
-from airflow.utils.dates import days_ago
+import re
 import sys
 import os
 import pendulum
 
 # Add plugins directory to path
-plugins_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "plugins")
-sys.path.insert(0, plugins_path)
+plugins_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "plugins")
+if plugins_path not in sys.path:
+    sys.path.insert(0, plugins_path)
 
 # Add config directory to path
-config_path = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, config_path)
+config_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if config_path not in sys.path:
+    sys.path.insert(0, config_path)
 
 from config.config import (
     DAG_ID,
@@ -46,89 +50,110 @@ default_args = {
     "retry_delay": timedelta(minutes=DAG_RETRY_DELAY_MINUTES),
 }
 
+# Title keyword -> reported role, in priority order
+ROLE_MAP = {
+    "data engineer": "Data Engineer",
+    "analytics engineer": "Analytics Engineer",
+    "data scientist": "Data Scientist",
+}
+ROLE_PRIORITY = {keyword: rank for rank, keyword in enumerate(ROLE_MAP)}
+# One case-insensitive scan per title
+ROLE_RE = re.compile("|".join(map(re.escape, ROLE_MAP)), re.IGNORECASE)
+
 # =============================================================================
 # Task Functions
 # =============================================================================
 
-def scrape_jobs_task(**context):
+def _classify(title: str) -> str:
+    """Map a job title to its reported role."""
+    keywords = {match.group(0).lower() for match in ROLE_RE.finditer(title)}
+    if not keywords:
+        return "Other"
+    return ROLE_MAP[min(keywords, key=ROLE_PRIORITY.__getitem__)]
+
+
+def scrape_jobs_task(ti, ts_nodash, **_):
     """
     Task to scrape job listings from multiple sources.
-    Pushes the list of jobs to XCom for the next task.
+    Saves the jobs to a Parquet file and pushes its path to XCom.
     """
     from job_scraper import scrape_all_jobs
+    from job_store import prune_jobs, save_jobs
+    
+    # Hand-off files from earlier runs are no longer needed
+    prune_jobs(f"jobs_{ts_nodash}")
     
     print("Starting multi-source job scraping...")
     print(f"Searching for roles: {', '.join(JOB_TITLES)}")
     
     jobs = scrape_all_jobs()
     
-    # Push jobs to XCom
-    context["ti"].xcom_push(key="jobs", value=jobs)
-    
-    # Log summary by source
-    sources = {}
-    for job in jobs:
-        source = job.get("source", "Unknown")
-        sources[source] = sources.get(source, 0) + 1
-    
-    print(f"\nSummary by source:")
-    for source, count in sources.items():
-        print(f"  - {source}: {count} jobs")
+    # Persist jobs to disk on a worker thread (Parquet encoding releases the GIL)
+    # while the summary is logged, then push only the path to XCom
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        save_future = executor.submit(save_jobs, jobs, f"jobs_{ts_nodash}")
+        
+        # Log summary by source
+        sources = Counter(job.source for job in jobs)
+        
+        print(f"\nSummary by source:")
+        for source, count in sources.items():
+            print(f"  - {source}: {count} jobs")
+        
+        jobs_path = save_future.result()
+    
+    ti.xcom_push(key="jobs_path", value=jobs_path)
     
     print(f"\nTotal: {len(jobs)} jobs scraped successfully")
     return len(jobs)
 
 
-def export_csv_task(**context):
+def export_csv_task(ti, **_):
     """
     Task to export scraped jobs to CSV.
-    Pulls jobs from XCom and pushes the CSV filepath.
+    Loads jobs from the Parquet file referenced in XCom and pushes the CSV filepath.
     """
     from csv_exporter import export_to_csv
+    from job_store import iter_jobs
     
-    # Pull jobs from previous task
-    ti = context["ti"]
-    jobs = ti.xcom_pull(task_ids="scrape_jobs", key="jobs")
+    # Pull jobs file path from previous task
+    jobs_path = ti.xcom_pull(task_ids="scrape_jobs", key="jobs_path")
     
-    if jobs is None:
-        jobs = []
+    if jobs_path is None:
+        jobs = iter(())
         print("Warning: No jobs received from scraper")
+    else:
+        jobs = iter_jobs(jobs_path)
+    
+    # Calculate breakdown by role while the rows stream into the CSV
+    role_counts = Counter()
     
-    print(f"Exporting {len(jobs)} jobs to CSV...")
-    csv_filepath = export_to_csv(jobs)
+    def _count_roles(rows):
+        for job in rows:
+            role_counts[_classify(job.get("title", ""))] += 1
+            yield job
+    
+    print(f"Exporting jobs from {jobs_path} to CSV...")
+    csv_filepath = export_to_csv(_count_roles(jobs))
+    job_count = sum(role_counts.values())
     
     # Push filepath to XCom
     ti.xcom_push(key="csv_filepath", value=csv_filepath)
-    ti.xcom_push(key="job_count", value=len(jobs))
-    
-    # Calculate breakdown by role
-    role_counts = {}
-    for job in jobs:
-        title = job.get("title", "").lower()
-        if "data engineer" in title:
-            role = "Data Engineer"
-        elif "analytics engineer" in title:
-            role = "Analytics Engineer"
-        elif "data scientist" in title:
-            role = "Data Scientist"
-        else:
-            role = "Other"
-        role_counts[role] = role_counts.get(role, 0) + 1
-    
-    ti.xcom_push(key="role_counts", value=role_counts)
+    ti.xcom_push(key="job_count", value=job_count)
+    
+    ti.xcom_push(key="role_counts", value=dict(role_counts))
     
     print(f"CSV exported to: {csv_filepath}")
     return csv_filepath
 
 
-def send_notification_task(**context):
+def send_notification_task(ti, **_):
     """
     Task to send SNS notification about the job scan results.
     Pulls job count and CSV filepath from XCom.
     """
     from sns_notifier import send_notification
     
-    ti = context["ti"]
     job_count = ti.xcom_pull(task_ids="export_csv", key="job_count") or 0
     csv_filepath = ti.xcom_pull(task_ids="export_csv", key="csv_filepath") or "Unknown"
     role_counts = ti.xcom_pull(task_ids="export_csv", key="role_counts") or {}
@@ -158,7 +183,7 @@ with DAG(
     default_args=default_args,
     description="Scrapes Data Engineer, Analytics Engineer, and Data Scientist jobs every 6 hours starting at 6AM PST",
     schedule_interval=SCHEDULE_INTERVAL,
-    start_date=datetime(2024, 1, 1, tzinfo=local_tz),
+    start_date=datetime(2024, 1, 1, tzinfo=local_tz),  # PST timezone
     catchup=False,
     tags=["jobs", "multi-source", "data-engineer", "analytics-engineer", "data-scientist", "scraper"],
     doc_md="""
@@ -200,21 +225,18 @@ with DAG(
     scrape_jobs = PythonOperator(
         task_id="scrape_jobs",
         python_callable=scrape_jobs_task,
-        provide_context=True,
     )
     
     # Task 2: Export to CSV
     export_csv = PythonOperator(
         task_id="export_csv",
         python_callable=export_csv_task,
-        provide_context=True,
     )
     
     # Task 3: Send notification
     send_notification = PythonOperator(
         task_id="send_notification",
         python_callable=send_notification_task,
-        provide_context=True,
     )
     
     # Define task dependencies
@@ -4,30 +4,48 @@ CSV Exporter Module
 Exports job listings to timestamped CSV files with enhanced columns
 for multi-source job data.
 """
+import csv
 import os
-import pandas as pd
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, Iterable
 import sys
+import time
 
 # Add parent directory to path for config import
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _path not in sys.path:
+    sys.path.insert(0, _path)
 
-from config.config import OUTPUT_DIR, CSV_FILENAME_PREFIX
+from config.config import OUTPUT_DIR, OUTPUT_PATH, CSV_FILENAME_PREFIX
+
+# Set once the output directory is known to exist in this process
+_ENSURED = False
 
 
 def ensure_output_dir():
-    """Create output directory if it doesn't exist."""
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
+    """Create output directory if it doesn't exist (checked once per process)."""
+    global _ENSURED
+    if _ENSURED:
+        return
+    
+    try:
+        OUTPUT_PATH.mkdir(parents=True)
         print(f"Created output directory: {OUTPUT_DIR}")
+    except FileExistsError:
+        pass
+    _ENSURED = True
 
 
-def export_to_csv(jobs: list) -> str:
+def export_to_csv(jobs: Iterable[Dict]) -> str:
     """
     Export job listings to a CSV file.
     
+    Rows are written as they are consumed, so ``jobs`` may be a lazy
+    iterator (e.g. from ``job_store.iter_jobs``) and is only read once.
+    
     Args:
-        jobs: List of job dictionaries
+        jobs: Iterable of job dictionaries
         
     Returns:
         str: Path to the created CSV file
@@ -35,7 +53,7 @@ def export_to_csv(jobs: list) -> str:
     ensure_output_dir()
     
     # Generate timestamped filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     filename = f"{CSV_FILENAME_PREFIX}_{timestamp}.csv"
     filepath = os.path.join(OUTPUT_DIR, filename)
     
@@ -58,37 +76,38 @@ def export_to_csv(jobs: list) -> str:
         "description_snippet"
     ]
     
-    if not jobs:
-        print("No jobs to export, creating empty CSV with headers")
-        df = pd.DataFrame(columns=columns)
-    else:
-        df = pd.DataFrame(jobs)
-        
-        # Reorder columns (only include columns that exist)
-        existing_columns = [col for col in columns if col in df.columns]
-        df = df[existing_columns]
+    # Stream rows straight to disk (extra keys such as job_family are dropped),
+    # collecting source and remote counts in the same pass
+    total = 0
+    source_counts = Counter()
+    remote_count = 0
+    with open(filepath, "w", newline="", encoding="utf-8", buffering=1 << 16) as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for job in jobs:
+            writer.writerow(job)
+            total += 1
+            source_counts[sys.intern(job.get('source', 'Unknown'))] += 1
+            remote_count += bool(job.get('remote'))
     
-    # Export to CSV
-    df.to_csv(filepath, index=False, encoding="utf-8")
+    if not total:
+        print("No jobs to export, created empty CSV with headers")
     
     # Print summary
     print(f"\n{'=' * 50}")
     print(f"CSV Export Summary")
     print(f"{'=' * 50}")
-    print(f"Total jobs exported: {len(jobs)}")
+    print(f"Total jobs exported: {total}")
     print(f"File: {filepath}")
     
-    if jobs:
+    if total:
         # Summary by source
-        source_counts = df['source'].value_counts().to_dict() if 'source' in df.columns else {}
         print(f"\nBy Source:")
-        for source, count in source_counts.items():
+        for source, count in source_counts.most_common():
             print(f"  - {source}: {count}")
         
         # Summary by remote status
-        if 'remote' in df.columns:
-            remote_count = df['remote'].sum()
-            print(f"\nRemote jobs: {remote_count} ({remote_count/len(jobs)*100:.1f}%)")
+        print(f"\nRemote jobs: {remote_count} ({remote_count/total*100:.1f}%)")
     
     print(f"{'=' * 50}\n")
     
@@ -104,15 +123,15 @@ def get_latest_csv() -> str:
     """
     ensure_output_dir()
     
-    csv_files = [f for f in os.listdir(OUTPUT_DIR) if f.endswith(".csv")]
-    
-    if not csv_files:
-        return None
-    
-    # Sort by modification time, get most recent
-    csv_files.sort(key=lambda x: os.path.getmtime(os.path.join(OUTPUT_DIR, x)), reverse=True)
+    # Single O(N) max() pass instead of sorting every CSV by mtime
+    with os.scandir(OUTPUT_DIR) as entries:
+        latest = max(
+            (entry for entry in entries if entry.name.endswith(".csv")),
+            key=lambda entry: entry.stat().st_mtime,
+            default=None,
+        )
     
-    return os.path.join(OUTPUT_DIR, csv_files[0])
+    return latest.path if latest else None
 
 
 if __name__ == "__main__":
@@ -133,7 +152,7 @@ if __name__ == "__main__":
             "salary_currency": "USD",
             "experience_required": "3-7 years",
             "source": "JSearch (LinkedIn/Indeed)",
-            "scraped_at": datetime.now().isoformat()
+            "scraped_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
         },
         {
             "job_id": "adzuna_456",
@@ -150,7 +169,7 @@ if __name__ == "__main__":
             "salary_currency": "USD",
             "experience_required": "3-7 years",
             "source": "Adzuna (Monster/CareerBuilder)",
-            "scraped_at": datetime.now().isoformat()
+            "scraped_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
         },
         {
             "job_id": "remoteok_789",
@@ -167,7 +186,7 @@ if __name__ == "__main__":
             "salary_currency": "USD",
             "experience_required": "3-7 years",
             "source": "RemoteOK (Remote Jobs)",
-            "scraped_at": datetime.now().isoformat()
+            "scraped_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
         }
     ]
     
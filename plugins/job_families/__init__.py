@@ -1,6 +1,7 @@
 # Job Families package
+from job_families.fetching import fetch_pages
 from job_families.data_engineer import DataEngineerJobFamily
 from job_families.analytics_engineer import AnalyticsEngineerJobFamily
 from job_families.data_scientist_etl import DataScientistETLJobFamily
 
-__all__ = ['DataEngineerJobFamily', 'AnalyticsEngineerJobFamily', 'DataScientistETLJobFamily']
+__all__ = ['DataEngineerJobFamily', 'AnalyticsEngineerJobFamily', 'DataScientistETLJobFamily', 'fetch_pages']
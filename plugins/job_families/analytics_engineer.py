@@ -3,36 +3,43 @@ Analytics Engineer Job Family Module
 
 Handles scraping and filtering for Analytics Engineer positions.
 """
-from typing import List, Dict
+from collections import Counter
+import logging
+from typing import List
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _path not in sys.path:
+    sys.path.insert(0, _path)
 
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, JobRecord
 from scrapers.jsearch_scraper import JSearchScraper
 from scrapers.adzuna_scraper import AdzunaScraper
 from scrapers.remoteok_scraper import RemoteOKScraper
-from config.config import MAX_PAGES_PER_SOURCE, EXPERIENCE_MIN_YEARS, EXPERIENCE_MAX_YEARS
+from job_families.fetching import fetch_pages
+from config.config import EXPERIENCE_MIN_YEARS, EXPERIENCE_MAX_YEARS
+
+logger = logging.getLogger(__name__)
 
 
 class AnalyticsEngineerJobFamily:
     """Job family handler for Analytics Engineer positions."""
     
     JOB_TITLE = "Analytics Engineer"
-    SEARCH_TERMS = [
+    SEARCH_TERMS = (
         "Analytics Engineer",
         "Senior Analytics Engineer",
         "Lead Analytics Engineer",
         "BI Engineer",
-    ]
+    )
     
     # Skills specific to Analytics Engineers
-    REQUIRED_SKILLS = [
+    REQUIRED_SKILLS = frozenset([
         "sql", "dbt", "looker", "tableau", "power bi",
         "snowflake", "bigquery", "redshift", "data modeling",
         "python", "git", "airflow", "fivetran"
-    ]
+    ])
     
     def __init__(self):
         self.scrapers = [
@@ -41,28 +48,28 @@ class AnalyticsEngineerJobFamily:
             RemoteOKScraper()
         ]
     
-    def scrape_jobs(self) -> List[Dict]:
+    def scrape_jobs(self) -> List[JobRecord]:
         """
         Scrape Analytics Engineer jobs from all sources.
         
         Returns:
-            list: List of filtered and normalized job dictionaries
+            list: List of filtered and normalized JobRecords
         """
         all_jobs = []
         seen_job_ids = set()
+        source_counts = Counter()
+        
+        logger.info("Scraping: %s", self.JOB_TITLE)
+        
+        # All sources and pages are fetched concurrently up front
+        pages_by_source = fetch_pages(self.scrapers, (self.JOB_TITLE,))
         
-        print(f"\n{'=' * 50}")
-        print(f"Scraping: {self.JOB_TITLE}")
-        print(f"{'=' * 50}")
+        # One timestamp for the whole batch, taken once the pages are in
+        scraped_at = BaseScraper.utc_timestamp()
         
+        # Process results in source/page order so output stays deterministic
         for scraper in self.scrapers:
-            print(f"\n[{scraper.source_name}] Searching for {self.JOB_TITLE}...")
-            
-            for page in range(1, MAX_PAGES_PER_SOURCE + 1):
-                jobs = scraper.fetch_jobs(self.JOB_TITLE, page)
-                
-                if not jobs:
-                    break
+            for jobs in pages_by_source[(self.JOB_TITLE, scraper)]:
                 
                 for job in jobs:
                     # Create unique ID
@@ -79,19 +86,22 @@ class AnalyticsEngineerJobFamily:
                     
                     # Normalize and add
                     job["job_id"] = job_id
-                    normalized = BaseScraper.normalize_job_data(job, scraper.source_name)
-                    normalized["job_family"] = self.JOB_TITLE
+                    normalized = BaseScraper.normalize_job_data(job, scraper.source_name, scraped_at)
+                    normalized.job_family = self.JOB_TITLE
                     all_jobs.append(normalized)
+                    source_counts[scraper.source_name] += 1
             
-            print(f"    Found {len([j for j in all_jobs if scraper.source_name in j['source']])} jobs")
+            # One record per source: families run concurrently and share the log
+            logger.info("[%s] %s: found %d jobs", scraper.source_name, self.JOB_TITLE, source_counts[scraper.source_name])
         
-        print(f"\nTotal {self.JOB_TITLE} jobs: {len(all_jobs)}")
+        logger.info("Total %s jobs: %d", self.JOB_TITLE, len(all_jobs))
         return all_jobs
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     family = AnalyticsEngineerJobFamily()
     jobs = family.scrape_jobs()
     print(f"\nSample jobs:")
     for job in jobs[:3]:
-        print(f"  - {job['title']} at {job['company']}")
+        print(f"  - {job.title} at {job.company}")
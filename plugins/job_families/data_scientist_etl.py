@@ -4,30 +4,36 @@ Data Scientist (ETL Focus) Job Family Module
 Handles scraping and filtering for Data Scientist positions
 that require ETL and data engineering skills.
 """
-from typing import List, Dict
+import logging
+from typing import List
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _path not in sys.path:
+    sys.path.insert(0, _path)
 
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, JobRecord
 from scrapers.jsearch_scraper import JSearchScraper
 from scrapers.adzuna_scraper import AdzunaScraper
 from scrapers.remoteok_scraper import RemoteOKScraper
-from config.config import MAX_PAGES_PER_SOURCE, EXPERIENCE_MIN_YEARS, EXPERIENCE_MAX_YEARS, ETL_SKILLS
+from job_families.fetching import fetch_pages
+from config.config import EXPERIENCE_MIN_YEARS, EXPERIENCE_MAX_YEARS, ETL_SKILLS
+
+logger = logging.getLogger(__name__)
 
 
 class DataScientistETLJobFamily:
     """Job family handler for Data Scientist positions requiring ETL skills."""
     
     JOB_TITLE = "Data Scientist"
-    SEARCH_TERMS = [
+    SEARCH_TERMS = (
         "Data Scientist",
         "Data Scientist ETL",
         "Data Scientist SQL",
         "Data Scientist Python",
         "Machine Learning Engineer",
-    ]
+    )
     
     # ETL-focused skills required for Data Scientists
     REQUIRED_ETL_SKILLS = ETL_SKILLS
@@ -42,38 +48,33 @@ class DataScientistETLJobFamily:
     
     def _has_etl_skills(self, description: str) -> bool:
         """Check if Data Scientist role requires ETL skills."""
-        if not description:
-            return False
-        
-        text = description.lower()
-        skill_count = sum(1 for skill in self.REQUIRED_ETL_SKILLS if skill in text)
-        return skill_count >= self.MIN_SKILLS_REQUIRED
+        return BaseScraper.count_etl_skills(description, limit=self.MIN_SKILLS_REQUIRED) >= self.MIN_SKILLS_REQUIRED
     
-    def scrape_jobs(self) -> List[Dict]:
+    def scrape_jobs(self) -> List[JobRecord]:
         """
         Scrape Data Scientist jobs with ETL requirements from all sources.
         
         Returns:
-            list: List of filtered and normalized job dictionaries
+            list: List of filtered and normalized JobRecords
         """
         all_jobs = []
         seen_job_ids = set()
         
-        print(f"\n{'=' * 50}")
-        print(f"Scraping: {self.JOB_TITLE} (with ETL skills)")
-        print(f"Required skills: {', '.join(self.REQUIRED_ETL_SKILLS[:5])}...")
-        print(f"{'=' * 50}")
+        logger.info("Scraping: %s (with ETL skills)", self.JOB_TITLE)
+        logger.info("Required skills: %s...", ", ".join(self.REQUIRED_ETL_SKILLS[:5]))
+        
+        # All search terms, sources and pages are fetched concurrently up front
+        pages_by_source = fetch_pages(self.scrapers, self.SEARCH_TERMS)
+        
+        # One timestamp for the whole batch, taken once the pages are in
+        scraped_at = BaseScraper.utc_timestamp()
         
+        # Process results in term/source/page order so output stays deterministic
         for search_term in self.SEARCH_TERMS:
             for scraper in self.scrapers:
-                print(f"\n[{scraper.source_name}] Searching for '{search_term}'...")
+                logger.debug("[%s] Searching for '%s'...", scraper.source_name, search_term)
                 
-                for page in range(1, MAX_PAGES_PER_SOURCE + 1):
-                    jobs = scraper.fetch_jobs(search_term, page)
-                    
-                    if not jobs:
-                        break
-                    
+                for jobs in pages_by_source[(search_term, scraper)]:
                     for job in jobs:
                         # Create unique ID
                         job_id = f"{scraper.source_name.split()[0].lower()}_{job['job_id']}"
@@ -94,17 +95,18 @@ class DataScientistETLJobFamily:
                         
                         # Normalize and add
                         job["job_id"] = job_id
-                        normalized = BaseScraper.normalize_job_data(job, scraper.source_name)
-                        normalized["job_family"] = f"{self.JOB_TITLE} (ETL)"
+                        normalized = BaseScraper.normalize_job_data(job, scraper.source_name, scraped_at)
+                        normalized.job_family = f"{self.JOB_TITLE} (ETL)"
                         all_jobs.append(normalized)
         
-        print(f"\nTotal {self.JOB_TITLE} (ETL) jobs: {len(all_jobs)}")
+        logger.info("Total %s (ETL) jobs: %d", self.JOB_TITLE, len(all_jobs))
         return all_jobs
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     family = DataScientistETLJobFamily()
     jobs = family.scrape_jobs()
     print(f"\nSample jobs:")
     for job in jobs[:3]:
-        print(f"  - {job['title']} at {job['company']}")
+        print(f"  - {job.title} at {job.company}")
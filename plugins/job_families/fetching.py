@@ -0,0 +1,50 @@
+"""
+Job Family Fetching Module
+
+Concurrent page fetching shared by all job families.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple
+import sys
+import os
+
+_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _path not in sys.path:
+    sys.path.insert(0, _path)
+
+from scrapers.base_scraper import BaseScraper
+from config.config import MAX_PAGES_PER_SOURCE
+
+
+def fetch_pages(scrapers: List[BaseScraper], search_terms: Iterable[str],
+                max_pages: int = MAX_PAGES_PER_SOURCE) -> Dict[Tuple[str, BaseScraper], List[List[Dict]]]:
+    """
+    Fetch result pages for every (search term, scraper) pair concurrently.
+
+    Each pair runs on its own worker and walks its pages in order, stopping
+    at the first empty page, so no request is made past the end of a source.
+
+    Args:
+        scrapers: Scrapers to query
+        search_terms: Search terms to query each scraper with
+        max_pages: Maximum pages to fetch per pair
+
+    Returns:
+        dict: (search_term, scraper) -> non-empty pages in page order,
+              truncated at the first empty page
+    """
+    streams = [(term, scraper) for term in search_terms for scraper in scrapers]
+
+    def fetch(term: str, scraper: BaseScraper) -> List[List[Dict]]:
+        pages = []
+        for page in range(1, max_pages + 1):
+            jobs = scraper.fetch_jobs(term, page)
+            if not jobs:
+                break
+            pages.append(jobs)
+        return pages
+
+    with ThreadPoolExecutor(max_workers=max(len(streams), 1)) as executor:
+        futures = {stream: executor.submit(fetch, *stream) for stream in streams}
+
+    return {stream: future.result() for stream, future in futures.items()}
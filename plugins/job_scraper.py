@@ -4,34 +4,46 @@ Job Scraper Orchestrator
 Coordinates scraping across all job families and scrapers.
 Uses the modular scraper and job family structure.
 """
+import logging
 import sys
 import os
-from typing import List, Dict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 from datetime import datetime
 
 # Add paths
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+for _path in (
+    os.path.dirname(os.path.abspath(__file__)),
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
+from scrapers.base_scraper import JobRecord
 from job_families.data_engineer import DataEngineerJobFamily
 from job_families.analytics_engineer import AnalyticsEngineerJobFamily
 from job_families.data_scientist_etl import DataScientistETLJobFamily
 
+logger = logging.getLogger(__name__)
 
-def scrape_all_jobs() -> List[Dict]:
+
+def scrape_all_jobs() -> List[JobRecord]:
     """
     Main orchestrator function to scrape jobs from all families and sources.
     
     Returns:
-        list: Combined list of all job dictionaries
+        list: Combined list of all JobRecords
     """
     all_jobs = []
+    # Exact, per-run dedup: bounded by one run's postings, so a set stays small
+    # and, unlike a Bloom filter, never drops a new job as a false positive
     seen_job_ids = set()
+    family_counts = Counter()
+    source_counts = Counter()
     
-    print(f"\n{'=' * 60}")
-    print(f"🚀 Multi-Source Job Scraper - Orchestrator")
-    print(f"⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'=' * 60}")
+    logger.info("🚀 Multi-Source Job Scraper - Orchestrator")
+    logger.info("⏰ Time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
     
     # Initialize all job families
     job_families = [
@@ -40,43 +52,35 @@ def scrape_all_jobs() -> List[Dict]:
         DataScientistETLJobFamily(),
     ]
     
-    # Scrape from each family
-    for family in job_families:
-        print(f"\n{'─' * 60}")
-        jobs = family.scrape_jobs()
-        
-        for job in jobs:
-            if job['job_id'] not in seen_job_ids:
-                seen_job_ids.add(job['job_id'])
+    # Scrape all families concurrently (independent, I/O-bound work)
+    with ThreadPoolExecutor(max_workers=len(job_families)) as executor:
+        futures = [executor.submit(family.scrape_jobs) for family in job_families]
+    
+    # Merge in family order once every family is done, so deduplication
+    # (first family wins) does not depend on which family finished first.
+    # Summary counts are tallied in the same pass.
+    for future in futures:
+        for job in future.result():
+            if job.job_id not in seen_job_ids:
+                seen_job_ids.add(job.job_id)
                 all_jobs.append(job)
+                family_counts[job.job_family] += 1
+                source_counts[job.source] += 1
     
     # Print summary
-    print(f"\n{'=' * 60}")
-    print(f"📊 FINAL SUMMARY")
-    print(f"{'=' * 60}")
+    logger.info("📊 FINAL SUMMARY")
     
     # By job family
-    family_counts = {}
-    for job in all_jobs:
-        family = job.get('job_family', 'Unknown')
-        family_counts[family] = family_counts.get(family, 0) + 1
-    
-    print(f"\nBy Job Family:")
+    logger.info("By Job Family:")
     for family, count in family_counts.items():
-        print(f"  • {family}: {count}")
+        logger.info("  • %s: %d", family, count)
     
     # By source
-    source_counts = {}
-    for job in all_jobs:
-        source = job.get('source', 'Unknown')
-        source_counts[source] = source_counts.get(source, 0) + 1
-    
-    print(f"\nBy Source:")
+    logger.info("By Source:")
     for source, count in source_counts.items():
-        print(f"  • {source}: {count}")
+        logger.info("  • %s: %d", source, count)
     
-    print(f"\n✅ TOTAL JOBS: {len(all_jobs)}")
-    print(f"{'=' * 60}\n")
+    logger.info("✅ TOTAL JOBS: %d", len(all_jobs))
     
     return all_jobs
 
@@ -86,15 +90,16 @@ scrape_jobs = scrape_all_jobs
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     jobs = scrape_all_jobs()
     
     print("\nSample jobs from each family:")
     shown_families = set()
     for job in jobs:
-        family = job.get('job_family', 'Unknown')
+        family = job.job_family
         if family not in shown_families:
             shown_families.add(family)
             print(f"\n[{family}]")
-            print(f"  {job['title']} at {job['company']}")
-            print(f"  Location: {job['location']}")
-            print(f"  Source: {job['source']}")
+            print(f"  {job.title} at {job.company}")
+            print(f"  Location: {job.location}")
+            print(f"  Source: {job.source}")
@@ -0,0 +1,95 @@
+"""
+Job Store Module
+
+Persists scraped job listings to compressed Parquet files so Airflow
+tasks can hand off a file path through XCom instead of the full job list.
+"""
+import glob
+import os
+import sys
+from dataclasses import fields
+from typing import Dict, Iterator, List
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Add paths
+for _path in (
+    os.path.dirname(os.path.abspath(__file__)),
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from config.config import OUTPUT_DIR
+from scrapers.base_scraper import JobRecord
+
+
+def _jobs_to_table(jobs: List[JobRecord]) -> pa.Table:
+    """
+    Build an Arrow table from job records, one column per JobRecord field.
+
+    Boolean fields (e.g. ``remote``) keep their type; every other field is
+    stored as a string, since scrapers mix numbers and "" for salaries.
+    """
+    columns = {}
+    for field in fields(JobRecord):
+        values = [getattr(job, field.name) for job in jobs]
+        if field.type is bool:
+            columns[field.name] = pa.array(values, type=pa.bool_())
+        else:
+            columns[field.name] = pa.array(
+                ["" if value is None else str(value) for value in values],
+                type=pa.string(),
+            )
+
+    return pa.table(columns)
+
+
+def save_jobs(jobs: List[JobRecord], name: str) -> str:
+    """
+    Write job listings to a zstd-compressed Parquet file.
+
+    Args:
+        jobs: List of job records
+        name: File name (without extension) inside the output directory
+
+    Returns:
+        str: Path to the written Parquet file
+    """
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    filepath = os.path.join(OUTPUT_DIR, f"{name}.parquet")
+
+    pq.write_table(_jobs_to_table(jobs), filepath, compression="zstd")
+    return filepath
+
+
+def prune_jobs(keep: str) -> None:
+    """
+    Delete Parquet files left behind by earlier runs.
+
+    Files stay on disk until the next run so failed or cleared downstream
+    tasks can re-read them.
+
+    Args:
+        keep: File name (without extension) of the current run's file
+    """
+    keep_path = os.path.join(OUTPUT_DIR, f"{keep}.parquet")
+    for filepath in glob.glob(os.path.join(OUTPUT_DIR, "jobs_*.parquet")):
+        if filepath != keep_path:
+            os.remove(filepath)
+
+
+def iter_jobs(filepath: str) -> Iterator[Dict]:
+    """
+    Stream job listings from a Parquet file one record batch at a time.
+
+    Args:
+        filepath: Path to the Parquet file
+
+    Yields:
+        dict: One job dictionary per row
+    """
+    parquet_file = pq.ParquetFile(filepath, memory_map=True)
+    for batch in parquet_file.iter_batches():
+        yield from batch.to_pylist()
@@ -1,7 +1,7 @@
 # Scrapers package
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, JobRecord
 from scrapers.jsearch_scraper import JSearchScraper
 from scrapers.adzuna_scraper import AdzunaScraper
 from scrapers.remoteok_scraper import RemoteOKScraper
 
-__all__ = ['BaseScraper', 'JSearchScraper', 'AdzunaScraper', 'RemoteOKScraper']
+__all__ = ['BaseScraper', 'JobRecord', 'JSearchScraper', 'AdzunaScraper', 'RemoteOKScraper']
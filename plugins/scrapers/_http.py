@@ -0,0 +1,167 @@
+"""
+Shared HTTP Client Module
+
+Single connection-pooled HTTP/2 client reused by every scraper, so pages
+from the same host share keep-alive connections instead of new TLS handshakes.
+"""
+import atexit
+import hashlib
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+import orjson
+
+_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _path not in sys.path:
+    sys.path.insert(0, _path)
+
+from config.config import HTTP_CACHE_DIR, HTTP_CACHE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+CLIENT = httpx.Client(
+    # The transport also retries failed connection attempts
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    ),
+    follow_redirects=True,
+    timeout=30.0,
+)
+
+atexit.register(CLIENT.close)
+
+# Requests go out back to back; only throttling or a transient server error
+# from the provider slows us down
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+BACKOFF_SECONDS = 1.0
+MAX_RETRY_DELAY = 30.0
+
+# A failed request falls back to a cached entry only up to this many TTLs old,
+# so a revoked key or lasting outage surfaces instead of replaying old listings
+STALE_IF_ERROR_TTLS = 4
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else exponential backoff."""
+    try:
+        delay = float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        delay = BACKOFF_SECONDS * 2 ** attempt
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+
+def get_with_backoff(url: str, **kwargs) -> httpx.Response:
+    """GET through the shared client, retrying rate-limited (429) and transient 5xx responses."""
+    for attempt in range(MAX_RETRIES):
+        response = CLIENT.get(url, **kwargs)
+        if response.status_code not in RETRY_STATUS_CODES:
+            return response
+        time.sleep(_retry_delay(response, attempt))
+    return CLIENT.get(url, **kwargs)
+
+
+# One lock per cache entry, so concurrent identical requests (e.g. every family
+# asking for the RemoteOK feed at once) go out once and the rest read the cache
+_ENTRY_LOCKS: Dict[str, threading.Lock] = {}
+_ENTRY_LOCKS_GUARD = threading.Lock()
+
+
+def _entry_lock(path: str) -> threading.Lock:
+    """Lock guarding one cache entry."""
+    with _ENTRY_LOCKS_GUARD:
+        return _ENTRY_LOCKS.setdefault(path, threading.Lock())
+
+
+def _cache_path(url: str, params: Optional[Dict]) -> str:
+    """Cache file for a URL and its query parameters (hashed, so keys stay off disk)."""
+    key = orjson.dumps([url, params or {}], option=orjson.OPT_SORT_KEYS)
+    return os.path.join(HTTP_CACHE_DIR, f"{hashlib.sha256(key).hexdigest()}.json")
+
+
+def _read_cache(path: str) -> Optional[Dict]:
+    """Load a cache entry, or None if it is missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _write_cache(path: str, entry: Dict) -> None:
+    """Atomically replace a cache entry; caching is best effort."""
+    tmp_path = f"{path}.{os.getpid()}.{time.monotonic_ns()}.tmp"
+    try:
+        os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(entry))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not write HTTP cache entry: %s", e)
+
+
+def get_json(url: str, headers: Optional[Dict] = None, params: Optional[Dict] = None) -> Any:
+    """
+    GET a JSON API response, served from the on-disk cache when possible.
+
+    Fresh entries (younger than HTTP_CACHE_TTL_SECONDS) skip the request.
+    Expired entries are revalidated with If-None-Match / If-Modified-Since,
+    so a 304 reuses the cached data, and are served stale if the request fails
+    while younger than STALE_IF_ERROR_TTLS times the TTL.
+    Concurrent calls for the same entry wait for the first one's response.
+
+    Args:
+        url: Request URL
+        headers: Request headers
+        params: Query parameters (part of the cache key)
+
+    Returns:
+        Parsed JSON body
+    """
+    if HTTP_CACHE_TTL_SECONDS <= 0:
+        response = get_with_backoff(url, headers=headers, params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    path = _cache_path(url, params)
+    with _entry_lock(path):
+        entry = _read_cache(path)
+        if entry is not None and time.time() - entry["fetched_at"] < HTTP_CACHE_TTL_SECONDS:
+            return entry["data"]
+
+        headers = dict(headers or {})
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            response = get_with_backoff(url, headers=headers, params=params)
+            if response.status_code == 304 and entry is not None:
+                data = entry["data"]
+            else:
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError):
+            if entry is None or time.time() - entry["fetched_at"] >= STALE_IF_ERROR_TTLS * HTTP_CACHE_TTL_SECONDS:
+                raise
+            logger.warning("Request failed, using cached response for %s", url)
+            return entry["data"]
+
+        # A 304 may omit validators; keep the stored ones so later requests stay conditional
+        previous = entry if response.status_code == 304 and entry is not None else {}
+        _write_cache(path, {
+            "fetched_at": time.time(),
+            "etag": response.headers.get("etag") or previous.get("etag"),
+            "last_modified": response.headers.get("last-modified") or previous.get("last_modified"),
+            "data": data,
+        })
+        return data
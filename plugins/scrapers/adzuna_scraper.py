@@ -3,16 +3,23 @@ Adzuna Scraper Module
 
 Fetches jobs from Adzuna API (Monster, CareerBuilder, SimplyHired).
 """
-import requests
-from typing import List, Dict
+import logging
+from typing import Iterator, List, Dict
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+for _path in (
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 from config.config import ADZUNA_APP_ID, ADZUNA_APP_KEY, JOB_LOCATION, JOB_COUNTRY_CODE, RESULTS_PER_PAGE
 from scrapers.base_scraper import BaseScraper
+from scrapers._http import get_json
+
+logger = logging.getLogger(__name__)
 
 
 class AdzunaScraper(BaseScraper):
@@ -24,7 +31,7 @@ class AdzunaScraper(BaseScraper):
     def fetch_jobs(self, job_title: str, page: int = 1) -> List[Dict]:
         """Fetch jobs from Adzuna API."""
         if not ADZUNA_APP_ID or not ADZUNA_APP_KEY:
-            print("Warning: Adzuna API keys not configured, skipping Adzuna")
+            logger.warning("Adzuna API keys not configured, skipping Adzuna")
             return []
         
         url = f"https://api.adzuna.com/v1/api/jobs/{JOB_COUNTRY_CODE}/search/{page}"
@@ -40,36 +47,36 @@ class AdzunaScraper(BaseScraper):
         }
         
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            jobs = []
-            for job in data.get("results", []):
-                location = job.get("location", {})
-                location_str = ", ".join(location.get("display_name", "").split(", ")[:2])
-                
-                jobs.append({
-                    "job_id": str(job.get("id", "")),
-                    "title": job.get("title", ""),
-                    "company": job.get("company", {}).get("display_name", ""),
-                    "location": location_str,
-                    "job_type": job.get("contract_type", "Full-time"),
-                    "remote": "remote" in job.get("title", "").lower() or "remote" in job.get("description", "").lower(),
-                    "posted_date": job.get("created", ""),
-                    "apply_link": job.get("redirect_url", ""),
-                    "description": job.get("description", ""),
-                    "salary_min": job.get("salary_min", ""),
-                    "salary_max": job.get("salary_max", ""),
-                    "salary_currency": "USD",
-                })
-            return jobs
+            return list(self._parse_jobs(get_json(url, params=params)))
         except Exception as e:
-            print(f"Error fetching from Adzuna: {e}")
+            logger.error("Error fetching from Adzuna: %s", e)
             return []
+    
+    @staticmethod
+    def _parse_jobs(data: Dict) -> Iterator[Dict]:
+        """Translate Adzuna results into the common job format, one at a time."""
+        for job in data.get("results", []):
+            location = job.get("location", {})
+            location_str = ", ".join(location.get("display_name", "").split(", ")[:2])
+            
+            yield {
+                "job_id": str(job.get("id", "")),
+                "title": job.get("title", ""),
+                "company": job.get("company", {}).get("display_name", ""),
+                "location": location_str,
+                "job_type": job.get("contract_type", "Full-time"),
+                "remote": "remote" in job.get("title", "").lower() or "remote" in job.get("description", "").lower(),
+                "posted_date": job.get("created", ""),
+                "apply_link": job.get("redirect_url", ""),
+                "description": job.get("description", ""),
+                "salary_min": job.get("salary_min", ""),
+                "salary_max": job.get("salary_max", ""),
+                "salary_currency": "USD",
+            }
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     scraper = AdzunaScraper()
     jobs = scraper.fetch_jobs("Data Engineer", page=1)
     print(f"Found {len(jobs)} jobs from Adzuna")
@@ -5,14 +5,58 @@ Abstract base class and common utilities for all job scrapers.
 """
 import re
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
-from datetime import datetime
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, List, Dict, Optional
+from datetime import datetime, timezone
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _path not in sys.path:
+    sys.path.insert(0, _path)
 
-from config.config import EXPERIENCE_MIN_YEARS, EXPERIENCE_MAX_YEARS, ETL_SKILLS
+from config.config import EXPERIENCE_MIN_YEARS, EXPERIENCE_MAX_YEARS, ETL_SKILLS_RE
+
+# Experience requirement patterns fused into one alternation, so a description
+# is scanned once. A range anywhere beats "N+ years", which beats the first
+# plain "N years" ("minimum"/"at least" phrasings always contain one, so they
+# share its priority).
+# Written to backtrack linearly: numbers are only matched from their first
+# digit, and no two \s* runs are separated by an optional token alone.
+EXPERIENCE_RE = re.compile(
+    r'(?P<range>(?<!\d)(?P<range_min>\d+)\s*[-–to]+\s*(?P<range_max>\d+)(?:\s*\+)?\s*years?\s*(?:of)?\s*(?:experience|exp)?)'
+    r'|(?P<plus>(?<!\d)(?P<plus_years>\d+)\s*\+\s*years?\s*(?:of)?\s*(?:experience|exp)?)'
+    r'|(?P<single>(?<!\d)(?P<single_years>\d+)\s*years?\s*(?:of)?\s*(?:experience|exp)?)'
+    r'|(?P<minimum>minimum\s*(?:of\s*)?(?P<minimum_years>\d+)\s*years?)'
+    r'|(?P<least>at\s*least\s*(?P<least_years>\d+)\s*years?)',
+    re.IGNORECASE,
+)
+EXPERIENCE_PRIORITY = {"range": 0, "plus": 1, "single": 2, "minimum": 2, "least": 2}
+
+# Same for every record, so built once
+EXPERIENCE_LABEL = f"{EXPERIENCE_MIN_YEARS}-{EXPERIENCE_MAX_YEARS} years"
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """A normalized job listing (slotted: no per-record __dict__)."""
+    job_id: str
+    title: str
+    company: str
+    location: str
+    job_type: str
+    remote: bool
+    posted_date: str
+    apply_link: str
+    description_snippet: str
+    salary_min: Any
+    salary_max: Any
+    salary_currency: str
+    experience_required: str
+    source: str
+    scraped_at: str
+    job_family: str = ""
 
 
 class BaseScraper(ABC):
@@ -32,32 +76,32 @@ class BaseScraper(ABC):
         if not text:
             return None, None
         
-        text = text.lower()
+        # Every pattern needs "year"; a plain substring test rejects most
+        # descriptions far faster than the regex scan
+        if "year" not in text.lower():
+            return None, None
         
-        patterns = [
-            r'(\d+)\s*[-–to]+\s*(\d+)\s*(?:\+)?\s*years?\s*(?:of)?\s*(?:experience|exp)?',
-            r'(\d+)\s*\+\s*years?\s*(?:of)?\s*(?:experience|exp)?',
-            r'(\d+)\s*years?\s*(?:of)?\s*(?:experience|exp)?',
-            r'minimum\s*(?:of)?\s*(\d+)\s*years?',
-            r'at\s*least\s*(\d+)\s*years?',
-        ]
+        # Keep the highest-priority match; a range cannot be beaten, so stop there
+        best = None
+        for match in EXPERIENCE_RE.finditer(text):
+            if best is None or EXPERIENCE_PRIORITY[match.lastgroup] < EXPERIENCE_PRIORITY[best.lastgroup]:
+                best = match
+            if match.lastgroup == "range":
+                break
         
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                groups = match.groups()
-                if len(groups) == 2 and groups[1]:
-                    return int(groups[0]), int(groups[1])
-                elif groups[0]:
-                    years = int(groups[0])
-                    return years, years + 3
+        if best is not None:
+            if best.lastgroup == "range":
+                return int(best.group("range_min")), int(best.group("range_max"))
+            years = int(best.group(f"{best.lastgroup}_years"))
+            return years, years + 3
         
         return None, None
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def is_experience_in_range(description: str, min_years: int = EXPERIENCE_MIN_YEARS, 
                                 max_years: int = EXPERIENCE_MAX_YEARS) -> bool:
-        """Check if experience requirement is in range."""
+        """Check if experience requirement is in range (memoized: postings repeat across sources)."""
         req_min, req_max = BaseScraper.extract_years_of_experience(description)
         
         if req_min is None:
@@ -66,32 +110,52 @@ class BaseScraper(ABC):
         return not (req_max < min_years or req_min > max_years)
     
     @staticmethod
-    def has_etl_skills(text: str) -> bool:
-        """Check if description mentions ETL-related skills."""
+    @lru_cache(maxsize=4096)
+    def count_etl_skills(text: str, limit: Optional[int] = None) -> int:
+        """Count distinct ETL skills in text, stopping once `limit` are found (memoized like is_experience_in_range)."""
         if not text:
-            return False
+            return 0
         
-        text = text.lower()
-        skill_count = sum(1 for skill in ETL_SKILLS if skill in text)
-        return skill_count >= 2
+        found = set()
+        for match in ETL_SKILLS_RE.finditer(text):
+            found.add(match.group(1).lower())
+            if len(found) == limit:
+                break
+        return len(found)
     
     @staticmethod
-    def normalize_job_data(job: Dict, source: str) -> Dict:
-        """Normalize job data to common format."""
-        return {
-            "job_id": job.get("job_id", ""),
-            "title": job.get("title", ""),
-            "company": job.get("company", ""),
-            "location": job.get("location", ""),
-            "job_type": job.get("job_type", "Full-time"),
-            "remote": job.get("remote", False),
-            "posted_date": job.get("posted_date", ""),
-            "apply_link": job.get("apply_link", ""),
-            "description_snippet": job.get("description", "")[:500] + "..." if len(job.get("description", "")) > 500 else job.get("description", ""),
-            "salary_min": job.get("salary_min", ""),
-            "salary_max": job.get("salary_max", ""),
-            "salary_currency": job.get("salary_currency", "USD"),
-            "experience_required": f"{EXPERIENCE_MIN_YEARS}-{EXPERIENCE_MAX_YEARS} years",
-            "source": source,
-            "scraped_at": datetime.now().isoformat()
-        }
+    def has_etl_skills(text: str) -> bool:
+        """Check if description mentions ETL-related skills."""
+        return BaseScraper.count_etl_skills(text, limit=2) >= 2
+    
+    @staticmethod
+    def utc_timestamp() -> str:
+        """Current UTC time as an ISO-8601 string with seconds precision."""
+        return datetime.now(timezone.utc).isoformat(timespec="seconds")
+    
+    @staticmethod
+    def normalize_job_data(job: Dict, source: str, scraped_at: Optional[str] = None) -> JobRecord:
+        """
+        Normalize job data to common format, interning low-cardinality strings.
+        
+        Pass `scraped_at` to stamp a whole batch with one timestamp; it
+        defaults to the current UTC time.
+        """
+        description = job.get("description", "")
+        return JobRecord(
+            job_id=job.get("job_id", ""),
+            title=job.get("title", ""),
+            company=job.get("company", ""),
+            location=job.get("location", ""),
+            job_type=sys.intern(job.get("job_type", "Full-time") or ""),
+            remote=job.get("remote", False),
+            posted_date=job.get("posted_date", ""),
+            apply_link=job.get("apply_link", ""),
+            description_snippet=f"{description[:500]}..." if len(description) > 500 else description,
+            salary_min=job.get("salary_min", ""),
+            salary_max=job.get("salary_max", ""),
+            salary_currency=sys.intern(job.get("salary_currency", "USD") or ""),
+            experience_required=EXPERIENCE_LABEL,
+            source=sys.intern(source),
+            scraped_at=scraped_at or BaseScraper.utc_timestamp(),
+        )
@@ -3,16 +3,23 @@ JSearch Scraper Module
 
 Fetches jobs from JSearch API (LinkedIn, Indeed, Glassdoor, ZipRecruiter).
 """
-import requests
-from typing import List, Dict
+import logging
+from typing import Iterator, List, Dict
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+for _path in (
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 from config.config import RAPIDAPI_KEY, JSEARCH_HOST, JOB_LOCATION
 from scrapers.base_scraper import BaseScraper
+from scrapers._http import get_json
+
+logger = logging.getLogger(__name__)
 
 
 class JSearchScraper(BaseScraper):
@@ -24,7 +31,7 @@ class JSearchScraper(BaseScraper):
     def fetch_jobs(self, job_title: str, page: int = 1) -> List[Dict]:
         """Fetch jobs from JSearch API."""
         if not RAPIDAPI_KEY:
-            print("Warning: RAPIDAPI_KEY not configured, skipping JSearch")
+            logger.warning("RAPIDAPI_KEY not configured, skipping JSearch")
             return []
         
         url = "https://jsearch.p.rapidapi.com/search"
@@ -42,33 +49,33 @@ class JSearchScraper(BaseScraper):
         }
         
         try:
-            response = requests.get(url, headers=headers, params=querystring, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            jobs = []
-            for job in data.get("data", []):
-                jobs.append({
-                    "job_id": job.get("job_id", ""),
-                    "title": job.get("job_title", ""),
-                    "company": job.get("employer_name", ""),
-                    "location": f"{job.get('job_city', '')}, {job.get('job_state', '')}",
-                    "job_type": job.get("job_employment_type", ""),
-                    "remote": job.get("job_is_remote", False),
-                    "posted_date": job.get("job_posted_at_datetime_utc", ""),
-                    "apply_link": job.get("job_apply_link", ""),
-                    "description": job.get("job_description", ""),
-                    "salary_min": job.get("job_min_salary", ""),
-                    "salary_max": job.get("job_max_salary", ""),
-                    "salary_currency": job.get("job_salary_currency", "USD"),
-                })
-            return jobs
+            return list(self._parse_jobs(get_json(url, headers=headers, params=querystring)))
         except Exception as e:
-            print(f"Error fetching from JSearch: {e}")
+            logger.error("Error fetching from JSearch: %s", e)
             return []
+    
+    @staticmethod
+    def _parse_jobs(data: Dict) -> Iterator[Dict]:
+        """Translate JSearch results into the common job format, one at a time."""
+        for job in data.get("data", []):
+            yield {
+                "job_id": job.get("job_id", ""),
+                "title": job.get("job_title", ""),
+                "company": job.get("employer_name", ""),
+                "location": f"{job.get('job_city', '')}, {job.get('job_state', '')}",
+                "job_type": job.get("job_employment_type", ""),
+                "remote": job.get("job_is_remote", False),
+                "posted_date": job.get("job_posted_at_datetime_utc", ""),
+                "apply_link": job.get("job_apply_link", ""),
+                "description": job.get("job_description", ""),
+                "salary_min": job.get("job_min_salary", ""),
+                "salary_max": job.get("job_max_salary", ""),
+                "salary_currency": job.get("job_salary_currency", "USD"),
+            }
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     scraper = JSearchScraper()
     jobs = scraper.fetch_jobs("Data Engineer", page=1)
     print(f"Found {len(jobs)} jobs from JSearch")
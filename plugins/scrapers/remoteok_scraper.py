@@ -3,16 +3,30 @@ RemoteOK Scraper Module
 
 Fetches remote jobs from RemoteOK API (no API key required).
 """
-import requests
-from typing import List, Dict
+import logging
+import re
+from itertools import islice
+from typing import Iterator, List, Dict
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+for _path in (
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
-from config.config import REMOTEOK_ENABLED
+from config.config import REMOTEOK_ENABLED, REMOTEOK_TAGS
 from scrapers.base_scraper import BaseScraper
+from scrapers._http import get_json
+
+logger = logging.getLogger(__name__)
+
+# Keywords that mark a RemoteOK listing as a data role, matched in one scan
+RELEVANT_KEYWORDS_RE = re.compile(
+    "data engineer|analytics engineer|data scientist|etl|data pipeline", re.IGNORECASE
+)
 
 
 class RemoteOKScraper(BaseScraper):
@@ -25,9 +39,10 @@ class RemoteOKScraper(BaseScraper):
         """
         Fetch remote data jobs from RemoteOK API.
         Note: RemoteOK doesn't support pagination or specific search,
-        so we fetch all and filter.
+        so we fetch all (or the REMOTEOK_TAGS feeds) and filter; later pages
+        are empty to end pagination.
         """
-        if not REMOTEOK_ENABLED:
+        if not REMOTEOK_ENABLED or page > 1:
             return []
         
         url = "https://remoteok.com/api"
@@ -37,44 +52,50 @@ class RemoteOKScraper(BaseScraper):
         }
         
         try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            if not REMOTEOK_TAGS:
+                return list(self._parse_jobs(get_json(url, headers=headers)))
             
-            jobs = []
-            # Skip first item (it's metadata)
-            for job in data[1:]:
-                title = job.get("position", "").lower()
-                tags = " ".join(job.get("tags", [])).lower()
-                
-                # Filter for relevant job titles
-                is_relevant = any(
-                    keyword in title or keyword in tags
-                    for keyword in ["data engineer", "analytics engineer", "data scientist", "etl", "data pipeline"]
-                )
-                
-                if is_relevant:
-                    jobs.append({
-                        "job_id": str(job.get("id", "")),
-                        "title": job.get("position", ""),
-                        "company": job.get("company", ""),
-                        "location": "Remote - " + job.get("location", "Worldwide"),
-                        "job_type": "Full-time",
-                        "remote": True,
-                        "posted_date": job.get("date", ""),
-                        "apply_link": job.get("url", ""),
-                        "description": job.get("description", ""),
-                        "salary_min": job.get("salary_min", ""),
-                        "salary_max": job.get("salary_max", ""),
-                        "salary_currency": "USD",
-                    })
-            return jobs
+            # One feed per tag; a listing can carry several of the tags
+            jobs = {}
+            for tag in REMOTEOK_TAGS:
+                for job in self._parse_jobs(get_json(url, headers=headers, params={"tag": tag})):
+                    jobs.setdefault(job["job_id"], job)
+            return list(jobs.values())
         except Exception as e:
-            print(f"Error fetching from RemoteOK: {e}")
+            logger.error("Error fetching from RemoteOK: %s", e)
             return []
+    
+    @staticmethod
+    def _parse_jobs(data: List[Dict]) -> Iterator[Dict]:
+        """Yield relevant RemoteOK listings in the common job format, one at a time."""
+        # Skip first item (it's metadata)
+        for job in islice(data, 1, None):
+            # Filter for relevant job titles (title and tags searched separately,
+            # so a match cannot span the two)
+            is_relevant = (
+                RELEVANT_KEYWORDS_RE.search(job.get("position", ""))
+                or RELEVANT_KEYWORDS_RE.search(" ".join(job.get("tags", [])))
+            )
+            
+            if is_relevant:
+                yield {
+                    "job_id": str(job.get("id", "")),
+                    "title": job.get("position", ""),
+                    "company": job.get("company", ""),
+                    "location": "Remote - " + job.get("location", "Worldwide"),
+                    "job_type": "Full-time",
+                    "remote": True,
+                    "posted_date": job.get("date", ""),
+                    "apply_link": job.get("url", ""),
+                    "description": job.get("description", ""),
+                    "salary_min": job.get("salary_min", ""),
+                    "salary_max": job.get("salary_max", ""),
+                    "salary_currency": "USD",
+                }
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     scraper = RemoteOKScraper()
     jobs = scraper.fetch_jobs()
     print(f"Found {len(jobs)} remote data jobs from RemoteOK")
@@ -7,11 +7,15 @@ Enhanced to show breakdown by source and job role.
 import boto3
 from botocore.exceptions import ClientError
 from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List
 import sys
 import os
 
 # Add parent directory to path for config import
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _path not in sys.path:
+    sys.path.insert(0, _path)
 
 from config.config import (
     AWS_REGION,
@@ -25,8 +29,65 @@ from config.config import (
 )
 
 
+# Report layout; run-specific values are filled in by send_notification
+MESSAGE_TEMPLATE = """
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📊 Multi-Source Job Scraper Report
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+🕐 Scan Time: {timestamp}
+📍 Location: {location}
+📋 Experience: {min_years}-{max_years} years
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🎯 Job Titles Searched
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{title_bullets}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📈 Results Summary
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+✅ Total Jobs Found: {job_count}
+
+📊 By Role:
+{role_breakdown}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🌐 Data Sources Used
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+   • JSearch (LinkedIn, Indeed, Glassdoor, ZipRecruiter)
+   • Adzuna (Monster, CareerBuilder, SimplyHired)
+   • RemoteOK (Remote-focused positions)
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📁 CSV File Location
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{csv_filepath}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+⏰ Schedule: Every 6 hours (6AM, 12PM, 6PM, 12AM PST)
+📧 This is an automated message from your Job Scraper.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+# SNS accepts at most 10 entries per PublishBatch call
+SNS_BATCH_SIZE = 10
+
+# Fields that only depend on config, rendered once at import
+_STATIC_FIELDS = {
+    "location": JOB_LOCATION,
+    "min_years": EXPERIENCE_MIN_YEARS,
+    "max_years": EXPERIENCE_MAX_YEARS,
+    "title_bullets": "\n".join(f"   • {title}" for title in JOB_TITLES),
+}
+
+
+@lru_cache(maxsize=1)
 def get_sns_client():
-    """Initialize and return an SNS client."""
+    """Initialize and return an SNS client (built once and reused; boto3 clients are thread-safe)."""
     if AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY:
         return boto3.client(
             "sns",
@@ -67,48 +128,13 @@ def send_notification(job_count: int, csv_filepath: str, role_counts: dict = Non
     
     subject = f"🔔 Job Alert - {job_count} New Data/Analytics Positions Found"
     
-    message = f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📊 Multi-Source Job Scraper Report
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-🕐 Scan Time: {timestamp}
-📍 Location: {JOB_LOCATION}
-📋 Experience: {EXPERIENCE_MIN_YEARS}-{EXPERIENCE_MAX_YEARS} years
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-🎯 Job Titles Searched
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{chr(10).join([f'   • {title}' for title in JOB_TITLES])}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📈 Results Summary
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-✅ Total Jobs Found: {job_count}
-
-📊 By Role:
-{role_breakdown}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-🌐 Data Sources Used
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-   • JSearch (LinkedIn, Indeed, Glassdoor, ZipRecruiter)
-   • Adzuna (Monster, CareerBuilder, SimplyHired)
-   • RemoteOK (Remote-focused positions)
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📁 CSV File Location
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{csv_filepath}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-⏰ Schedule: Every 6 hours (6AM, 12PM, 6PM, 12AM PST)
-📧 This is an automated message from your Job Scraper.
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+    message = MESSAGE_TEMPLATE.format(
+        timestamp=timestamp,
+        job_count=job_count,
+        role_breakdown=role_breakdown,
+        csv_filepath=csv_filepath,
+        **_STATIC_FIELDS,
+    )
     
     try:
         response = client.publish(
@@ -141,6 +167,59 @@ def send_notification(job_count: int, csv_filepath: str, role_counts: dict = Non
         return False
 
 
+def send_notifications_batch(entries: List[Dict]) -> int:
+    """
+    Publish several notifications using as few SNS calls as possible.
+    
+    Args:
+        entries: Notifications as dicts with "subject" and "message" keys and
+                 optional "attributes" (SNS MessageAttributes)
+        
+    Returns:
+        int: Number of messages SNS accepted
+    """
+    if not SNS_TOPIC_ARN:
+        print("Warning: SNS_TOPIC_ARN not configured. Skipping notifications.")
+        return 0
+    
+    client = get_sns_client()
+    sent = 0
+    
+    for start in range(0, len(entries), SNS_BATCH_SIZE):
+        chunk = entries[start:start + SNS_BATCH_SIZE]
+        request_entries = []
+        for i, entry in enumerate(chunk, start=start):
+            request_entry = {
+                "Id": str(i),
+                "Subject": entry["subject"],
+                "Message": entry["message"],
+            }
+            if entry.get("attributes"):
+                request_entry["MessageAttributes"] = entry["attributes"]
+            request_entries.append(request_entry)
+        
+        try:
+            response = client.publish_batch(
+                TopicArn=SNS_TOPIC_ARN,
+                PublishBatchRequestEntries=request_entries
+            )
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            error_message = e.response["Error"]["Message"]
+            print(f"Failed to send notification batch: {error_code} - {error_message}")
+            continue
+        except Exception as e:
+            print(f"Unexpected error sending notification batch: {e}")
+            continue
+        
+        sent += len(response.get("Successful", []))
+        for failed in response.get("Failed", []):
+            print(f"Failed to send notification {failed['Id']}: {failed.get('Code')} - {failed.get('Message')}")
+    
+    print(f"Sent {sent}/{len(entries)} notifications.")
+    return sent
+
+
 def create_sns_topic(topic_name: str = "job-alerts") -> str:
     """Create an SNS topic if it doesn't exist."""
     client = get_sns_client()
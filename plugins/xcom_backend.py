@@ -0,0 +1,71 @@
+"""
+XCom Backend Module
+
+Custom XCom backend that serializes values with orjson instead of the
+standard library json module.
+
+Enable it with:
+    AIRFLOW__CORE__XCOM_BACKEND=xcom_backend.OrjsonXCom
+"""
+import math
+
+import orjson
+from airflow.models.xcom import BaseXCom
+from airflow.serialization.serde import CLASSNAME
+
+# Leave datetimes and dataclasses to _reject so they fall back to Airflow
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+_SCALAR_TYPES = (str, int, bool, type(None))
+
+
+def _reject(value):
+    """orjson ``default`` hook: refuse anything that is not plain JSON."""
+    raise TypeError(f"{type(value).__name__} is not plain JSON")
+
+
+def _is_plain_json(value) -> bool:
+    """
+    Check that a value round-trips through JSON unchanged.
+
+    Exact type checks keep tuples, enums, numpy values and other subclasses
+    on Airflow's serializer, which restores their original type.
+    """
+    value_type = type(value)
+    if value_type is float:
+        # orjson writes NaN and Infinity as null
+        return math.isfinite(value)
+    if value_type in _SCALAR_TYPES:
+        return True
+    if value_type is list:
+        return all(_is_plain_json(item) for item in value)
+    if value_type is dict:
+        return all(
+            type(key) is str and _is_plain_json(item)
+            for key, item in value.items()
+        )
+    return False
+
+
+class OrjsonXCom(BaseXCom):
+    """XCom backend using orjson for plain JSON-compatible values."""
+
+    @staticmethod
+    def serialize_value(value, **kwargs):
+        """Serialize plain JSON with orjson, deferring to Airflow for everything else."""
+        if _is_plain_json(value):
+            try:
+                return orjson.dumps(value, default=_reject, option=ORJSON_OPTIONS)
+            except TypeError:
+                pass
+        return BaseXCom.serialize_value(value, **kwargs)
+
+    @staticmethod
+    def deserialize_value(result):
+        """Deserialize with orjson, deferring to Airflow for its own encoded objects."""
+        payload = result.value
+        marker = CLASSNAME if isinstance(payload, str) else CLASSNAME.encode()
+        # Airflow nests encoded objects at any depth, so check the whole payload
+        if marker in payload:
+            return BaseXCom.deserialize_value(result)
+        return orjson.loads(payload)